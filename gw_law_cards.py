@@ -2,57 +2,284 @@
 import os
 import re
 import time
-import random
 import csv
+import email.utils
+import functools
 import hashlib
+import json
 import logging
-from typing import Generator, Optional
+import socket
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from typing import Any, Generator, Optional
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 import genanki
+import xxhash
 
 BASE = "https://www.law.gwu.edu/full-time-faculty"
+TARGET_HOST = urlparse(BASE).hostname
 HEADERS = {"User-Agent":"Don-anki-builder/1.0 (+contact: you@example.com)"}
 OUT_DIR = "out"
+MAX_WORKERS = 8
+REQUESTS_PER_SECOND = 2.0  # host-wide budget shared by all workers
+MAX_RETRIES = 3
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 MEDIA_DIR = os.path.join(OUT_DIR, "media")
+CACHE_DIR = os.path.join(OUT_DIR, "cache")
+CACHE_MAX_AGE = 7 * 24 * 3600  # seconds before a cached page is revalidated
+PARSER_VERSION = 1  # bump when parser output changes to invalidate cached parses
 os.makedirs(MEDIA_DIR, exist_ok=True)
+os.makedirs(CACHE_DIR, exist_ok=True)
 logger = logging.getLogger(__name__)
+_WS_RE = re.compile(r"\s+")
+# Directory pages only ever need the person cards; skip building the rest of the DOM.
+_CARD_STRAINER = SoupStrainer("div", class_="gw-person-card")
+# Drupal's pager marks the link to the following page with rel="next"; "next"
+# may be any whitespace-separated token of the rel value (e.g. rel="nofollow next").
+_NEXT_PAGE_RE = re.compile(
+    rb"""(?<![\w-])rel\s*=\s*(?:(["'])(?:[^"']*\s)?next(?:\s[^"']*)?\1|next(?=[\s/>]))""",
+    re.IGNORECASE,
+)
 
-def get(url: str) -> requests.Response:
-    """Fetch a URL with proper headers and error handling."""
-    logger.debug("Requesting %s", url)
-    r = requests.get(url, headers=HEADERS, timeout=30)
-    r.raise_for_status()
+class TokenBucket:
+    """Thread-safe token bucket that spaces requests to a fixed rate."""
+
+    def __init__(self, rps: float) -> None:
+        self.rps = rps
+        self.tokens = rps
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def take(self) -> None:
+        """Block until a request may be sent."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rps, self.tokens + (now - self.last) * self.rps)
+            self.last = now
+            if self.tokens < 1:
+                # Sleep while holding the lock so waiters are released in order.
+                time.sleep((1 - self.tokens) / self.rps)
+                self.tokens = 0
+                self.last = time.monotonic()
+            else:
+                self.tokens -= 1
+
+BUCKET = TokenBucket(REQUESTS_PER_SECOND)
+
+# One HTTP/2 client for every request: concurrent fetches from all workers
+# share a keep-alive TLS connection to the faculty site as multiplexed streams.
+# The transport retries failed connections; get() retries transient statuses.
+CLIENT = httpx.Client(
+    headers=HEADERS,
+    timeout=30,
+    follow_redirects=True,
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+    ),
+)
+
+_getaddrinfo = socket.getaddrinfo
+
+@functools.lru_cache(maxsize=128)
+def _cached_getaddrinfo(*args: Any) -> list:
+    return _getaddrinfo(*args)
+
+def _pinned_getaddrinfo(host: Any, *args: Any, **kwargs: Any) -> list:
+    if host == TARGET_HOST and not kwargs:
+        return _cached_getaddrinfo(host, *args)
+    return _getaddrinfo(host, *args, **kwargs)
+
+def pin_dns() -> None:
+    """Resolve TARGET_HOST once and answer later lookups for it from memory.
+
+    Every new connection otherwise repeats the same getaddrinfo() call.
+    Lookups for any other host are passed through untouched.
+    """
+    socket.getaddrinfo = _pinned_getaddrinfo
+    try:
+        socket.getaddrinfo(TARGET_HOST, 443, 0, socket.SOCK_STREAM)
+    except OSError as e:
+        logger.warning("Could not pre-resolve %s: %s", TARGET_HOST, e)
+
+def _retry_after(resp: httpx.Response) -> float:
+    """Seconds asked for by a Retry-After header (delay or HTTP date), else 0."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return 0.0
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, when.timestamp() - time.time())
+
+def get(
+    url: str, headers: Optional[dict[str, str]] = None, stream: bool = False
+) -> httpx.Response:
+    """Fetch a URL with proper headers and error handling.
+
+    Transport errors (timeouts, dropped connections, HTTP/2 resets) and
+    429/5xx responses are retried with exponential backoff, waiting at least
+    as long as any Retry-After header asks. A 304 is returned to the caller.
+    Streamed responses must be closed by the caller.
+    """
+    request = CLIENT.build_request("GET", url, headers=headers)
+    for attempt in range(MAX_RETRIES + 1):
+        BUCKET.take()
+        logger.debug("Requesting %s", url)
+        delay = 0.5 * 2**attempt
+        try:
+            r = CLIENT.send(request, stream=stream)
+        except httpx.TransportError as e:
+            if attempt == MAX_RETRIES:
+                raise
+            logger.debug("Retrying %s after %r", url, e)
+        else:
+            if r.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                break
+            r.close()
+            delay = max(delay, _retry_after(r))
+            logger.debug("Retrying %s after %s", url, r.status_code)
+        time.sleep(delay)
+    if r.is_error:
+        r.close()
+        r.raise_for_status()
     logger.debug("Received %s (%s)", url, r.status_code)
     return r
 
 
+def _write_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a temp file so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+def _read_json(path: str) -> Optional[dict]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _validators(resp: httpx.Response) -> dict[str, Optional[str]]:
+    """Cache validators to store alongside a response body."""
+    return {"etag": resp.headers.get("ETag"), "last_modified": resp.headers.get("Last-Modified")}
+
+def _conditional_headers(meta: dict) -> dict[str, str]:
+    """Request headers that revalidate a body stored with _validators()."""
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+def _cache_path(url: str, suffix: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode()).hexdigest() + suffix)
+
+def fetch_cached(url: str, max_age: float = CACHE_MAX_AGE) -> tuple[bytes, str]:
+    """Fetch a page through the on-disk cache and return (body, xxh64 digest).
+
+    Copies younger than max_age seconds are served without touching the
+    network; older ones are revalidated with If-None-Match/If-Modified-Since.
+    Pass max_age=0 to revalidate on every call.
+    """
+    html_path, meta_path = _cache_path(url, ".html"), _cache_path(url, ".meta.json")
+    headers = {}
+    if os.path.exists(html_path):
+        if time.time() - os.path.getmtime(html_path) < max_age:
+            logger.debug("Cache hit %s", url)
+            with open(html_path, "rb") as f:
+                body = f.read()
+            return body, xxhash.xxh64(body).hexdigest()
+        headers = _conditional_headers(_read_json(meta_path) or {})
+
+    resp = get(url, headers=headers)
+    if resp.status_code == 304:
+        logger.debug("Not modified %s", url)
+        os.utime(html_path)
+        with open(html_path, "rb") as f:
+            body = f.read()
+    else:
+        body = resp.content
+        _write_atomic(html_path, body)
+        _write_atomic(meta_path, json.dumps(_validators(resp)).encode())
+    return body, xxhash.xxh64(body).hexdigest()
+
+def _load_parsed(url: str, digest: str) -> Any:
+    """Return the cached parse of url if it was made from this exact body."""
+    cached = _read_json(_cache_path(url, ".parsed.json"))
+    if cached and cached.get("hash") == digest and cached.get("parser_version") == PARSER_VERSION:
+        return cached["data"]
+    return None
+
+def _store_parsed(url: str, digest: str, data: Any) -> None:
+    parsed = {"hash": digest, "parser_version": PARSER_VERSION, "data": data}
+    _write_atomic(_cache_path(url, ".parsed.json"), json.dumps(parsed).encode())
+
+
 def faculty_list_pages(
     start: str = BASE,
-) -> Generator[tuple[BeautifulSoup, str], None, None]:
-    """Iterate through paginated faculty directory pages."""
+) -> Generator[tuple[list[dict[str, str]], str], None, None]:
+    """Iterate through paginated faculty directory pages, yielding parsed entries.
+
+    Pages are revalidated against the on-disk cache on every run (a 304
+    reuses the cached parse), and pagination stops at the first
+    page without a rel="next" link rather than fetching an empty page.
+    """
     page = 0
     while True:
         url = start if page == 0 else f"{start}?page={page}"
-        resp = get(url)
-        soup = BeautifulSoup(resp.text, "html.parser")
+        # Always revalidate directory pages so roster changes and the pager are current
+        body, digest = fetch_cached(url, max_age=0)
+
+        # Check if there are any faculty cards on this page before parsing it
+        if b"gw-person-card" not in body:
+            logger.info("Reached end of pagination at page %d", page)
+            break
 
-        # Check if there are any faculty cards on this page
-        cards = soup.select("div.gw-person-card")
-        if len(cards) == 0:
+        entries = _load_parsed(url, digest)
+        if entries is None:
+            soup = BeautifulSoup(body, "lxml", parse_only=_CARD_STRAINER)
+            entries = parse_faculty_cards(soup, url)
+            _store_parsed(url, digest, entries)
+
+        # The byte probe can match non-card markup (e.g. gw-person-card-image in assets)
+        if not entries:
             logger.info("Reached end of pagination at page %d", page)
             break
 
-        yield soup, url
+        yield entries, url
+        if not _NEXT_PAGE_RE.search(body):
+            logger.info("Reached end of pagination at page %d", page)
+            break
         page += 1
-        time.sleep(random.uniform(1.5, 3.0))
 
 
+def _join_url(base: str, page_url: str, href: str) -> str:
+    """urljoin() with fast paths for absolute URLs and site-absolute paths."""
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("/") and not href.startswith("//"):
+        return base + href
+    return urljoin(page_url, href)
+
 def parse_faculty_cards(soup: BeautifulSoup, page_url: str) -> list[dict[str, str]]:
-    entries = []
-    cards = soup.select("div.gw-person-card")
+    entries = {}  # keyed by profile_url, first card wins
+    parsed = urlparse(page_url)
+    base = f"{parsed.scheme}://{parsed.netloc}"
+    cards = soup.find_all("div", class_="gw-person-card")
     logger.debug("Found %d gw-person-card divs on %s", len(cards), page_url)
     for card in cards:
         link = card.find("a", href=True)
@@ -62,7 +289,7 @@ def parse_faculty_cards(soup: BeautifulSoup, page_url: str) -> list[dict[str, st
         href = link["href"]
         if href.startswith("mailto:"):
             continue
-        full_url = urljoin(page_url, href)
+        full_url = _join_url(base, page_url, href)
         name = clean_text(link.get_text())
         heading = card.find(["h2", "h3", "h4"])
         if not name and heading:
@@ -77,102 +304,194 @@ def parse_faculty_cards(soup: BeautifulSoup, page_url: str) -> list[dict[str, st
             title = clean_text(title_candidate.get_text())
         # Get image from card with specific class
         img = card.find("img", class_="gw-person-card-image")
-        img_url = urljoin(page_url, img.get("src")) if img and img.get("src") else None
-        entries.append({"name": name, "title": title, "profile_url": full_url, "img_url": img_url})
-    # de-duplicate by profile_url
-    uniq = []
-    seen = set()
-    for entry in entries:
-        if entry["profile_url"] in seen:
-            continue
-        uniq.append(entry)
-        seen.add(entry["profile_url"])
-    return uniq
+        img_url = _join_url(base, page_url, img["src"]) if img and img.get("src") else None
+        entries.setdefault(
+            full_url, {"name": name, "title": title, "profile_url": full_url, "img_url": img_url}
+        )
+    return list(entries.values())
+
+@functools.lru_cache(maxsize=4096)
+def _clean_cached(txt: str) -> str:
+    return _WS_RE.sub(" ", txt).strip()
 
 def clean_text(txt: Optional[str]) -> str:
-    """Normalize whitespace in text."""
-    txt = re.sub(r"\s+", " ", txt or "").strip()
-    return txt
+    """Normalize whitespace in text.
+
+    Results are memoized since titles and names repeat across cards.
+    """
+    return _clean_cached(txt) if txt else ""
 
 
 def fetch_profile(profile_url: str) -> dict[str, str]:
-    resp = get(profile_url)
-    soup = BeautifulSoup(resp.text, "html.parser")
+    body, digest = fetch_cached(profile_url)
+    data = _load_parsed(profile_url, digest)
+    if data is None:
+        data = parse_profile(body)
+        _store_parsed(profile_url, digest, data)
+    return data
+
 
-    # Bio: first substantial paragraph in main content area
-    bio = ""
+def _is_bio(tag: Tag) -> bool:
+    """Match a substantial paragraph, skipping contact info and email addresses."""
+    if tag.name != "p":
+        return False
+    t = clean_text(tag.get_text())
+    return len(t) > 120 and "Contact:" not in t and "Email" not in t and "@" not in t
+
+
+def parse_profile(content: bytes) -> dict[str, str]:
+    soup = BeautifulSoup(content, "lxml")
+
+    # Bio: first substantial paragraph in main content area. find() stops
+    # walking the tree at the first match instead of collecting every <p>.
     main = soup.find("main")
-    if main:
-        for p in main.find_all("p"):
-            t = clean_text(p.get_text())
-            # Skip short text, contact info, and email addresses
-            if t and len(t) > 120 and "Contact:" not in t and "Email" not in t and "@" not in t:
-                bio = t
-                break
+    bio_tag = main.find(_is_bio) if main else None
 
     # If no bio found in main, try all paragraphs
-    if not bio:
-        for p in soup.select("p"):
-            t = clean_text(p.get_text())
-            if t and len(t) > 120 and "Contact:" not in t and "Email" not in t and "@" not in t:
-                bio = t
-                break
+    if bio_tag is None:
+        bio_tag = soup.find(_is_bio)
 
-    return {"bio": bio}
+    return {"bio": clean_text(bio_tag.get_text()) if bio_tag else ""}
 
 
+class ContentIndex:
+    """Persistent, thread-safe map of image content hash -> filename and URL -> content hash.
+
+    Lets different URLs serving identical bytes (e.g. the same portrait at
+    another size, or a shared placeholder) resolve to a single media file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.lock = threading.Lock()
+        data = _read_json(path) or {}
+        self.content: dict[str, str] = data.get("content", {})
+        self.urls: dict[str, str] = data.get("urls", {})
+
+    def filename_for_url(self, url: str) -> Optional[str]:
+        """Return the stored filename for url's known content, if it is still on disk."""
+        with self.lock:
+            filename = self.content.get(self.urls.get(url, ""))
+        if filename and os.path.exists(os.path.join(MEDIA_DIR, filename)):
+            return filename
+        return None
+
+    def commit(self, url: str, digest: str, tmp: str, filename: str) -> str:
+        """Move a downloaded temp file into place unless its content is already stored.
+
+        tmp must be unique to this call. Returns the filename holding the content.
+        """
+        with self.lock:
+            existing = self.content.get(digest)
+            if existing and os.path.exists(os.path.join(MEDIA_DIR, existing)):
+                os.remove(tmp)
+                filename = existing
+            else:
+                os.replace(tmp, os.path.join(MEDIA_DIR, filename))
+                self.content[digest] = filename
+            self.urls[url] = digest
+            _write_atomic(self.path, json.dumps({"content": self.content, "urls": self.urls}).encode())
+        return filename
+
+MEDIA_INDEX = ContentIndex(os.path.join(MEDIA_DIR, "content_index.json"))
+
 def download_image(url: Optional[str]) -> Optional[tuple[str, str]]:
-    """Download an image and return (path, filename)."""
+    """Download an image and return (path, filename).
+
+    MEDIA_INDEX decides what is fetched: URLs whose content is already
+    indexed are served without a request and are never revalidated. Other
+    images are streamed to disk and hashed on the way, and content already
+    stored under another filename is not kept twice.
+    """
     if not url:
         return None
-    filename = hashlib.sha1(url.encode()).hexdigest() + os.path.splitext(urlparse(url).path)[1][:5]
+    known = MEDIA_INDEX.filename_for_url(url)
+    if known:
+        logger.debug("Image content already stored %s", known)
+        return os.path.join(MEDIA_DIR, known), known
+    ext = os.path.splitext(urlparse(url).path)[1][:5]
+    # Keep using images saved under the older SHA-1 names; new ones use xxh64.
+    filename = hashlib.sha1(url.encode()).hexdigest() + ext
     path = os.path.join(MEDIA_DIR, filename)
     if not os.path.exists(path):
-        logger.info("Downloading image %s", url)
-        r = get(url)
-        with open(path, "wb") as f:
-            f.write(r.content)
-        time.sleep(random.uniform(1.5, 3.0))
-    else:
+        filename = xxhash.xxh64(url.encode()).hexdigest() + ext
+        path = os.path.join(MEDIA_DIR, filename)
+    if os.path.exists(path):
         logger.debug("Image already exists %s", path)
-    return path, filename
+        return path, filename
+    with closing(get(url, stream=True)) as r:
+        logger.info("Downloading image %s", url)
+        hasher = xxhash.xxh64()
+        # Unique per call: workers may fetch the same URL (e.g. a shared placeholder) at once.
+        fd, tmp = tempfile.mkstemp(dir=MEDIA_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            for chunk in r.iter_bytes(64 * 1024):
+                hasher.update(chunk)
+                f.write(chunk)
+    stored = MEDIA_INDEX.commit(url, hasher.hexdigest(), tmp, filename)
+    if stored != filename:
+        logger.info("Image %s duplicates %s", url, stored)
+    return os.path.join(MEDIA_DIR, stored), stored
 
-def scrape_all() -> list[dict[str, str]]:
-    people = []
-    for soup, url in faculty_list_pages():
-        entries = parse_faculty_cards(soup, url)
-        logger.info("Parsed %d faculty entries from %s", len(entries), url)
-        people.extend(entries)
-        time.sleep(random.uniform(1.0, 2.0))
-    # Deduplicate by profile URL
-    keyed, out = {}, []
-    for p in people:
-        keyed[p["profile_url"]] = p
-    for prof in keyed.values():
-        logger.info("Fetching profile %s", prof["profile_url"])
+def _fetch_record(prof: dict[str, str]) -> dict[str, str]:
+    """Fetch one profile page and headshot and merge them with the directory card.
+
+    HTTP failures are logged and leave the record incomplete rather than
+    aborting the scrape.
+    """
+    logger.info("Fetching profile %s", prof["profile_url"])
+    try:
         data = fetch_profile(prof["profile_url"])
-        # Merge card data with profile data (card data takes precedence)
-        record = {**data, **prof}
-        if not record.get("bio"):
-            logger.warning("Missing bio for %s", record.get("name") or record["profile_url"])
-        out.append(record)
-        time.sleep(random.uniform(1.5, 3.0))
-    return out
+    except httpx.HTTPError as e:
+        logger.warning("Could not fetch profile %s: %s", prof["profile_url"], e)
+        data = {}
+    # Merge card data with profile data (card data takes precedence)
+    record = {**data, **prof}
+    if not record.get("bio"):
+        logger.warning("Missing bio for %s", record.get("name") or record["profile_url"])
+    # Download the image in the same task so it reuses the worker's warm connection
+    res = None
+    try:
+        res = download_image(record.get("img_url"))
+    except httpx.HTTPError as e:
+        logger.warning("Could not download image for %s: %s", record.get("name") or record["profile_url"], e)
+    if res:
+        _, fn = res
+        record["image_filename"] = fn
+        logger.info("Downloaded image for %s", record.get("name","(unknown)"))
+    elif not record.get("img_url"):
+        logger.warning("No image URL for %s", record.get("name") or record["profile_url"])
+    return record
+
+def scrape_all() -> list[dict[str, str]]:
+    # Each faculty member is fetched (profile + image) on a bounded pool as soon
+    # as their directory page is parsed, so that I/O overlaps with pagination.
+    futures = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        for entries, url in faculty_list_pages():
+            logger.info("Parsed %d faculty entries from %s", len(entries), url)
+            for prof in entries:
+                # Deduplicate by profile URL
+                if prof["profile_url"] not in futures:
+                    futures[prof["profile_url"]] = pool.submit(_fetch_record, prof)
+        return [f.result() for f in futures.values()]
 
 def export_csv(rows: list[dict[str, str]], path: str) -> None:
     fields = ["FrontImage","Name","Title","Bio","SourceURL","ImageSource"]
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fields)
-        w.writeheader()
-        for r in rows:
-            w.writerow({
-                "FrontImage": r.get("image_filename") or "",
-                "Name": r.get("name",""),
-                "Title": r.get("title",""),
-                "Bio": r.get("bio",""),
-                "SourceURL": r.get("profile_url",""),
-                "ImageSource": r.get("img_url",""),
-            })
+        w = csv.writer(f)
+        w.writerow(fields)
+        w.writerows(
+            (
+                r.get("image_filename") or "",
+                r.get("name",""),
+                r.get("title",""),
+                r.get("bio",""),
+                r.get("profile_url",""),
+                r.get("img_url",""),
+            )
+            for r in rows
+        )
 
 def export_apkg(rows: list[dict[str, str]], path: str) -> None:
     model = genanki.Model(
@@ -192,12 +511,12 @@ def export_apkg(rows: list[dict[str, str]], path: str) -> None:
         }],
         css=".card { font-family: -apple-system, Segoe UI, Roboto, Helvetica, Arial; font-size: 16px; } img { max-width: 100%; height:auto; }")
     deck = genanki.Deck(2059400110, "GW Law — Full-Time Faculty")
-    media = []
+    # Faculty can share an image file; list each file once so it is packed once.
+    media = sorted({os.path.join(MEDIA_DIR, r["image_filename"]) for r in rows if r.get("image_filename")})
     for r in rows:
         front_html = ""
         if r.get("image_filename"):
             front_html = f"<img src='{r['image_filename']}' />"
-            media.append(os.path.join(MEDIA_DIR, r["image_filename"]))
         note = genanki.Note(
             model=model,
             fields=[front_html, r.get("name",""), r.get("title",""), r.get("bio",""), r.get("profile_url","")],
@@ -214,20 +533,12 @@ def main() -> None:
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
+    # httpx logs every request at INFO; keep output to the scraper's own progress lines
+    logging.getLogger("httpx").setLevel(logging.WARNING)
     logger.info("Starting GW Law faculty scrape")
+    pin_dns()
     rows = scrape_all()
     logger.info("Fetched %d faculty profiles", len(rows))
-    # Download images and inject filenames
-    for r in rows:
-        img = r.get("img_url")
-        if img:
-            res = download_image(img)
-            if res:
-                _, fn = res
-                r["image_filename"] = fn
-                logger.info("Downloaded image for %s", r.get("name","(unknown)"))
-        else:
-            logger.warning("No image URL for %s", r.get("name") or r.get("profile_url"))
     os.makedirs(OUT_DIR, exist_ok=True)
     csv_path = os.path.join(OUT_DIR, "gwlaw_faculty.csv")
     apkg_path = os.path.join(OUT_DIR, "gwlaw_faculty.apkg")